@@ -1,6 +1,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # Copyright Contributors to the OpenTimelineIO project
+import functools
 import re
 
 import sphinx_rtd_theme
@@ -107,6 +108,22 @@ myst_heading_anchors = 5
 
 # -- Custom ----------------------------------------------------------------------------
 
+# Matches the "self" argument pybind11 adds to method signatures.
+_SELF_RE = re.compile(r"self: [a-zA-Z0-9._]+(,\s)?")
+
+# Overload signature patterns, compiled once per function name.
+_OVERLOAD_RE = {}
+
+
+def _overload_re(name):
+    pattern = _OVERLOAD_RE.get(name)
+    if pattern is None:
+        pattern = _OVERLOAD_RE[name] = re.compile(
+            fr"^\d+\.\s{re.escape(name)}(\(.*)"
+        )
+    return pattern
+
+
 def process_signature(
     app,
     what: str,
@@ -123,28 +140,46 @@ def process_signature(
       by Pybind11. Pybind11 adds the signature of each overload in the first function's
       signature. So the idea is to generate a new signature for each one instead.
     """
+    if not signature and what != "class":
+        # Nothing to rewrite (attributes, data, etc).
+        return "", return_annotation
+
+    init = getattr(obj, "__init__", None)
+    return _compute_signature(
+        what,
+        name,
+        obj.__doc__,
+        init and init.__doc__,
+        signature,
+        return_annotation,
+    )
+
+
+# The same objects are documented several times (inheritance, cross references),
+# so the result only depends on docstrings and names and can be memoized.
+@functools.lru_cache(maxsize=4096)
+def _compute_signature(what, name, doc, init_doc, signature, return_annotation):
     signatures = []
     isClass = what == "class"
 
     # This block won't be necessary once https://github.com/pybind/pybind11/pull/2621
     # gets merged in Pybind11.
     if signature or isClass:
-        docstrLines = obj.__doc__ and obj.__doc__.split("\n") or []
-        if not docstrLines or isClass:
+        docstr = doc or ""
+        if (not docstr or isClass) and init_doc:
             # A class can have part of its doc in its docstr or in the __init__ docstr.
-            docstrLines += (
-                obj.__init__.__doc__ and obj.__init__.__doc__.split("\n") or []
-            )
+            docstr = f"{docstr}\n{init_doc}" if docstr else init_doc
 
-        # This could be solidified by using a regex on the reconstructed docstr?
-        if len(docstrLines) > 1 and "Overloaded function." in docstrLines:
+        # Only split the docstring into lines when it contains overloads,
+        # which is not the common case.
+        if "Overloaded function." in docstr:
             # Overloaded function detected. Extract each signature and create a new
             # signature for each of them.
-            for line in docstrLines:
-                nameToMatch = name.split(".")[-1] if not isClass else "__init__"
-
+            nameToMatch = name.split(".")[-1] if not isClass else "__init__"
+            overloadRe = _overload_re(nameToMatch)
+            for line in docstr.splitlines():
                 # Maybe get use sphinx.util.inspect.signature_from_str ?
-                if match := re.search(fr"^\d+\.\s{nameToMatch}(\(.*)", line):
+                if match := overloadRe.search(line):
                     signatures.append(match.group(1))
         elif signature:
             signatures.append(signature)
@@ -153,8 +188,8 @@ def process_signature(
 
     # Remove self from signatures.
     for index, sig in enumerate(signatures):
-        newsig = re.sub(r"self\: [a-zA-Z0-9._]+(,\s)?", "", sig)
-        signatures[index] = newsig
+        if "self: " in sig:
+            signatures[index] = _SELF_RE.sub("", sig)
 
     signature = "\n".join(signatures)
     return signature, return_annotation
@@ -168,6 +203,8 @@ def process_docstring(
     options: dict[str, str],
     lines: list[str],
 ):
+    nameToMatch = name.split(".")[-1] if what != "class" else "__init__"
+    overloadRe = _overload_re(nameToMatch)
     for index, line in enumerate(lines):
         # Remove "self" from docstrings of overloaded functions/methods.
         # For overloaded functions/methods/classes, pybind11
@@ -179,8 +216,8 @@ def process_docstring(
         #
         # "self" is a distraction that can be removed to improve readability.
         # This should be removed once https://github.com/pybind/pybind11/pull/2621 is merged.
-        if re.match(fr'\d+\. {name.split("."[0])}', line):
-            line = re.sub(r"self\: [a-zA-Z0-9._]+(,\s)?", "", line)
+        if overloadRe.match(line):
+            line = _SELF_RE.sub("", line)
             lines[index] = line
 
 
@@ -8,15 +8,16 @@
 #include "opentimelineio/unknownSchema.h"
 #include "stringUtils.h"
 #include <cstddef>
+#include <memory>
 #include <string>
 
 #define RAPIDJSON_NAMESPACE OTIO_rapidjson
-#include <rapidjson/ostreamwrapper.h>
+#include <rapidjson/filewritestream.h>
 #include <rapidjson/prettywriter.h>
 #include <rapidjson/stringbuffer.h>
 #include <rapidjson/writer.h>
 
-#include <fstream>
+#include <cstdio>
 
 #if defined(_WINDOWS)
 #    ifndef WIN32_LEAN_AND_MEAN
@@ -1335,17 +1336,21 @@ serialize_json_to_file(
     int                       indent)
 {
 
+    FILE* fp = nullptr;
 #if defined(_WINDOWS)
     const int wlen =
         MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
     std::vector<wchar_t> wchars(wlen);
     MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
-    std::ofstream os(wchars.data());
+    if (_wfopen_s(&fp, wchars.data(), L"w") != 0)
+    {
+        fp = nullptr;
+    }
 #else  // _WINDOWS
-    std::ofstream os(file_name);
+    fp = fopen(file_name.c_str(), "w");
 #endif // _WINDOWS
 
-    if (!os.is_open())
+    if (!fp)
     {
         if (error_status)
         {
@@ -1355,16 +1360,23 @@ serialize_json_to_file(
         return false;
     }
 
-    OTIO_rapidjson::OStreamWrapper osw(os);
-    bool                           status;
+    // Closes the file if anything below throws, on success it is closed
+    // explicitly so that errors can be reported.
+    std::unique_ptr<FILE, int (*)(FILE*)> file_guard(fp, &fclose);
+
+    // Buffer the output and write it to the file in large blocks, rather
+    // than going through std::ostream::put for every character.
+    char                            writeBuffer[65536];
+    OTIO_rapidjson::FileWriteStream fs(fp, writeBuffer, sizeof(writeBuffer));
+    bool                            status;
 
     OTIO_rapidjson::PrettyWriter<
-        decltype(osw),
+        decltype(fs),
         OTIO_rapidjson::UTF8<>,
         OTIO_rapidjson::UTF8<>,
         OTIO_rapidjson::CrtAllocator,
         OTIO_rapidjson::kWriteNanAndInfFlag>
-                                       json_writer(osw);
+                                       json_writer(fs);
     JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
 
     if (indent >= 0)
@@ -1378,6 +1390,18 @@ serialize_json_to_file(
         schema_version_targets,
         error_status);
 
+    fs.Flush();
+    const bool write_failed = ferror(fp) != 0;
+    if ((fclose(file_guard.release()) != 0 || write_failed) && status)
+    {
+        if (error_status)
+        {
+            *error_status =
+                ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+        }
+        status = false;
+    }
+
     return status;
 }
 
@@ -108,49 +108,24 @@ For example, the duration of a clip from frame 10 to frame 15 is 6 frames. Resul
         .def_static("from_frames", &RationalTime::from_frames, "frame"_a, "rate"_a, "Turn a frame number and rate into a :class:`~RationalTime` object.")
         .def_static("from_seconds", static_cast<RationalTime (*)(double, double)> (&RationalTime::from_seconds), "seconds"_a, "rate"_a)
         .def_static("from_seconds", static_cast<RationalTime (*)(double)> (&RationalTime::from_seconds), "seconds"_a)
-        .def("to_frames", (int (RationalTime::*)() const) &RationalTime::to_frames, "Returns the frame number based on the current rate.")
-        .def("to_frames", (int (RationalTime::*)(double) const) &RationalTime::to_frames, "rate"_a, "Returns the frame number based on the given rate.")
+        .def("to_frames", [](RationalTime rt, std::optional<double> rate) {
+                return rate ? rt.to_frames(*rate) : rt.to_frames();
+        }, "rate"_a = std::nullopt, "Returns the frame number based on the given rate, or the current rate if none is given.")
         .def("to_seconds", &RationalTime::to_seconds)
-        .def("to_timecode", [](RationalTime rt, double rate, std::optional<bool> drop_frame) {
+        .def("to_timecode", [](RationalTime rt, std::optional<double> rate, std::optional<bool> drop_frame) {
                 return rt.to_timecode(
-                        rate,
+                        rate.value_or(rt.rate()),
                         df_enum_converter(drop_frame),
                         ErrorStatusConverter()
                 );
-        }, "rate"_a, "drop_frame"_a, "Convert to timecode (``HH:MM:SS;FRAME``)")
-        .def("to_timecode", [](RationalTime rt, double rate) {
-                return rt.to_timecode(
-                        rate,
-                        IsDropFrameRate::InferFromRate,
-                        ErrorStatusConverter()
-                );
-        }, "rate"_a)
-        .def("to_timecode", [](RationalTime rt) {
-                return rt.to_timecode(
-                        rt.rate(),
-                        IsDropFrameRate::InferFromRate,
-                        ErrorStatusConverter());
-                })
-        .def("to_nearest_timecode", [](RationalTime rt, double rate, std::optional<bool> drop_frame) {
+        }, "rate"_a = std::nullopt, "drop_frame"_a = std::nullopt, "Convert to timecode (``HH:MM:SS;FRAME``)")
+        .def("to_nearest_timecode", [](RationalTime rt, std::optional<double> rate, std::optional<bool> drop_frame) {
                 return rt.to_nearest_timecode(
-                        rate,
+                        rate.value_or(rt.rate()),
                         df_enum_converter(drop_frame),
                         ErrorStatusConverter()
                 );
-        }, "rate"_a, "drop_frame"_a, "Convert to nearest timecode (``HH:MM:SS;FRAME``)")
-        .def("to_nearest_timecode", [](RationalTime rt, double rate) {
-                return rt.to_nearest_timecode(
-                        rate,
-                        IsDropFrameRate::InferFromRate,
-                        ErrorStatusConverter()
-                );
-        }, "rate"_a)
-        .def("to_nearest_timecode", [](RationalTime rt) {
-                return rt.to_nearest_timecode(
-                        rt.rate(),
-                        IsDropFrameRate::InferFromRate,
-                        ErrorStatusConverter());
-                })
+        }, "rate"_a = std::nullopt, "drop_frame"_a = std::nullopt, "Convert to nearest timecode (``HH:MM:SS;FRAME``)")
         .def("to_time_string", &RationalTime::to_time_string)
         .def_static("from_timecode", [](std::string s, double rate) {
                 return RationalTime::from_timecode(s, rate, ErrorStatusConverter());
@@ -26,6 +26,7 @@ void otio_any_dictionary_bindings(py::module m) {
         .def("__getitem__", &AnyDictionaryProxy::get_item, "key"_a)
         .def("__internal_setitem__", &AnyDictionaryProxy::set_item, "key"_a, "item"_a)
         .def("__delitem__", &AnyDictionaryProxy::del_item, "key"_a)
+        .def("__internal_assign__", &AnyDictionaryProxy::assign, "mapping"_a)
         .def("__len__", &AnyDictionaryProxy::len)
         .def("__iter__", &AnyDictionaryProxy::iter, py::return_value_policy::reference_internal);
 }
@@ -82,6 +82,15 @@ struct AnyDictionaryProxy : public AnyDictionary::MutationStamp {
         m.erase(e);
     }
 
+    // Replace the whole content of the dictionary with the content of a
+    // python mapping, swapping in the converted dictionary rather than going
+    // through clear() and update().
+    void assign(py::object const& mapping) {
+        AnyDictionary& m = fetch_any_dictionary();
+        AnyDictionary converted = py_to_any_dictionary(mapping);
+        m.swap(converted);
+    }
+
     int len() {
         return int(fetch_any_dictionary().size());
     }
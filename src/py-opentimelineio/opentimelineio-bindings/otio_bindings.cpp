@@ -152,7 +152,7 @@ register_downgrade_function(
     
 }
 
-static void set_type_record(SerializableObject* so, std::string schema_name) {
+static void set_type_record(SerializableObject* so, std::string const& schema_name) {
     TypeRegistry::instance().set_type_record(so, schema_name, ErrorStatusHandler());
 }
 
@@ -183,13 +183,13 @@ PYBIND11_MODULE(_otio, m) {
             "_serialize_json_to_string",
             [](
                 PyAny* pyAny,
-                const schema_version_map& schema_version_targets,
+                const std::optional<schema_version_map>& schema_version_targets,
                 int indent
               ) 
             {
                 auto result = serialize_json_to_string(
                         pyAny->a,
-                        &schema_version_targets,
+                        schema_version_targets ? &*schema_version_targets : nullptr,
                         ErrorStatusHandler(),
                         indent
                 );
@@ -204,13 +204,13 @@ PYBIND11_MODULE(_otio, m) {
           [](
               PyAny* pyAny,
               std::string filename,
-              const schema_version_map& schema_version_targets,
+              const std::optional<schema_version_map>& schema_version_targets,
               int indent
           ) {
               return serialize_json_to_file(
                       pyAny->a,
                       filename,
-                      &schema_version_targets,
+                      schema_version_targets ? &*schema_version_targets : nullptr,
                       ErrorStatusHandler(),
                       indent
               );
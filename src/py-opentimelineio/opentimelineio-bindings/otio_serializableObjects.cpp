@@ -63,7 +63,9 @@ namespace {
     bool find_children(T* t, py::object descended_from_type, std::optional<TimeRange> const& search_range, bool shallow_search, std::vector<SerializableObject*>& l) {
         if (descended_from_type.is(py::type::handle_of<U>()))
         {
-            for (const auto& child : t->template find_children<U>(ErrorStatusHandler(), search_range, shallow_search)) {
+            auto children = t->template find_children<U>(ErrorStatusHandler(), search_range, shallow_search);
+            l.reserve(children.size());
+            for (const auto& child : children) {
                 l.push_back(child.value);
             }
             return true;
@@ -84,7 +86,9 @@ namespace {
         else if (find_children<T, Transition>(t, descended_from_type, search_range, shallow_search, l)) ;
         else
         {
-            for (const auto& child : t->template find_children<Composable>(ErrorStatusHandler(), search_range, shallow_search)) {
+            auto children = t->template find_children<Composable>(ErrorStatusHandler(), search_range, shallow_search);
+            l.reserve(children.size());
+            for (const auto& child : children) {
                 l.push_back(child.value);
             }
         }
@@ -93,8 +97,10 @@ namespace {
 
     template<typename T>
     std::vector<SerializableObject*> find_clips(T* t, std::optional<TimeRange> const& search_range, bool shallow_search = false) {
+        auto clips = t->find_clips(ErrorStatusHandler(), search_range, shallow_search);
         std::vector<SerializableObject*> l;
-        for (const auto& clip : t->find_clips(ErrorStatusHandler(), search_range, shallow_search)) {
+        l.reserve(clips.size());
+        for (const auto& clip : clips) {
             l.push_back(clip.value);
         }
         return l;
@@ -899,6 +905,15 @@ Negative ``start_frame`` is also handled. The above example with a ``start_frame
         .def("frame_for_time", [](ImageSequenceReference *seq_ref, RationalTime time) {
                 return seq_ref->frame_for_time(time, ErrorStatusHandler());
         }, "time"_a, "Given a :class:`.RationalTime` within the available range, returns the frame number.")
+        .def("frame_range_for_time_range", [](ImageSequenceReference *seq_ref, TimeRange time_range) {
+                int first_frame = seq_ref->frame_for_time(time_range.start_time(), ErrorStatusHandler());
+                int last_frame = seq_ref->frame_for_time(time_range.end_time_inclusive(), ErrorStatusHandler());
+                return std::make_pair(first_frame, last_frame);
+        }, "time_range"_a, R"docstring(Returns first and last frame numbers for
+the given time range in the reference.
+
+:raises ValueError: if the provided time range is outside the available range.
+)docstring")
         .def("target_url_for_image_number", [](ImageSequenceReference *seq_ref, int image_number) {
                 return seq_ref->target_url_for_image_number(
                         image_number,
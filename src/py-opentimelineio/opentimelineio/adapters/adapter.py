@@ -343,7 +343,13 @@ def _with_linked_media_references(
     Makes changes in place and returns the read_otio structure back.
     """
 
-    if not read_otio or not media_linker.from_name(media_linker_name):
+    if not read_otio:
+        return read_otio
+
+    # resolve the linker once up front rather than looking it up in the
+    # manifest again for every clip
+    linker = media_linker.from_name(media_linker_name)
+    if not linker:
         return read_otio
 
     # not every object the adapter reads has an "find_clips" method, so this
@@ -353,9 +359,8 @@ def _with_linked_media_references(
         return read_otio
 
     for cl in read_otio.find_clips():
-        new_mr = media_linker.linked_media_reference(
+        new_mr = linker.link_media_reference(
             cl,
-            media_linker_name,
             # @TODO: should any context get wired in at this point?
             media_linker_argument_map
         )
@@ -91,7 +91,7 @@ def serialize_json_to_string(root, schema_version_targets=None, indent=4):
     """
     return _serialize_json_to_string(
         _value_to_any(root),
-        schema_version_targets or {},
+        schema_version_targets,
         indent
     )
 
@@ -121,7 +121,7 @@ def serialize_json_to_file(
     return _serialize_json_to_file(
         _value_to_any(root),
         filename,
-        schema_version_targets or {},
+        schema_version_targets,
         indent
     )
 
@@ -149,12 +149,26 @@ def register_type(classobj, schemaname=None):
 
     register_serializable_object_type(classobj, schema_name, int(schema_version))
 
+    # Registering the same class again under the same schema must not wrap
+    # its __init__ twice. Only look at the class' own __init__, an inherited
+    # wrapper sets the schema of the parent class.
+    own_init = classobj.__dict__.get("__init__")
+    if getattr(own_init, "_otio_schema_name", None) == schema_name:
+        return classobj
+
+    # When the __init__ is inherited from another registered class, or was
+    # wrapped for a different schema name, wrap the original __init__ rather
+    # than stacking wrappers, so that constructing an instance only goes
+    # through one wrapper and sets its type record once.
     orig_init = classobj.__init__
+    orig_init = getattr(orig_init, "_otio_orig_init", orig_init)
 
     def __init__(self, *args, **kwargs):
         orig_init(self, *args, **kwargs)
         set_type_record(self, schema_name)
 
+    __init__._otio_orig_init = orig_init
+    __init__._otio_schema_name = schema_name
     classobj.__init__ = __init__
     return classobj
 
@@ -175,7 +189,8 @@ def upgrade_function_for(cls, version_to_upgrade_to):
     must be a class deriving from :class:`~SerializableObject`.
 
     The upgrade function should take a single argument - the dictionary to
-    upgrade, and return a dictionary with the fields upgraded.
+    upgrade, and return a dictionary with the fields upgraded. It can also
+    modify the dictionary in place and return it, or return nothing.
 
     Remember that you don't need to provide an upgrade function for upgrades
     that add or remove fields, only for schema versions that change the field
@@ -189,8 +204,10 @@ def upgrade_function_for(cls, version_to_upgrade_to):
         """ Decorator for marking upgrade functions """
         def wrapped_update(data):
             modified = func(data)
-            data.clear()
-            data.update(modified)
+            if modified is data or modified is None:
+                # modified in place
+                return
+            data.__internal_assign__(modified)
 
         register_upgrade_function(cls._serializable_label.split(".")[0],
                                   version_to_upgrade_to, wrapped_update)
@@ -216,7 +233,8 @@ def downgrade_function_from(cls, version_to_downgrade_from):
     :class:`~SerializableObject`.
 
     The downgrade function should take a single argument - the dictionary to
-    downgrade, and return a dictionary with the fields downgraded.
+    downgrade, and return a dictionary with the fields downgraded. It can also
+    modify the dictionary in place and return it, or return nothing.
 
     :param typing.Type[SerializableObject] cls: class to downgrade
     :param int version_to_downgrade_from: the function downgrading from this
@@ -227,8 +245,10 @@ def downgrade_function_from(cls, version_to_downgrade_from):
         """ Decorator for marking downgrade functions """
         def wrapped_update(data):
             modified = func(data)
-            data.clear()
-            data.update(modified)
+            if modified is data or modified is None:
+                # modified in place
+                return
+            data.__internal_assign__(modified)
 
         register_downgrade_function(
             cls._serializable_label.split(".")[0],
@@ -280,22 +300,33 @@ def serializable_field(name, required_type=None, doc=None, default_value=None):
     :rtype: :py:class:`property`
     """
 
-    def getter(self):
-        return self._dynamic_fields.get(name, default_value)
+    # name and default_value are bound as default arguments so the getter,
+    # which runs on every attribute read, doesn't go through closure cells.
+    def getter(self, _name=name, _default_value=default_value):
+        return self._dynamic_fields.get(_name, _default_value)
 
-    def setter(self, val):
-        # always allow None values regardless of value of required_type
-        if required_type is not None and val is not None:
-            if not isinstance(val, required_type):
+    if required_type is None:
+        def setter(self, val, _name=name):
+            self._dynamic_fields[_name] = val
+    else:
+        def setter(self, val, _name=name, _required_type=required_type):
+            # always allow None values regardless of value of required_type.
+            # Checking the exact type first skips the isinstance() MRO walk
+            # in the common case.
+            if (
+                    val is not None
+                    and type(val) is not _required_type
+                    and not isinstance(val, _required_type)
+            ):
                 raise TypeError(
                     "attribute '{}' must be an instance of '{}', not: {}".format(
-                        name,
-                        required_type,
+                        _name,
+                        _required_type,
                         type(val)
                     )
                 )
 
-        self._dynamic_fields[name] = val
+            self._dynamic_fields[_name] = val
 
     return property(getter, setter, doc=doc)
 
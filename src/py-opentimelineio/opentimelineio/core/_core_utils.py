@@ -6,6 +6,7 @@ import collections.abc
 import copy
 
 from .. import (
+    _opentime,
     _otio,
 )
 from .. _otio import (
@@ -39,79 +40,120 @@ def _is_nonstring_sequence(v):
 
 
 def _value_to_any(value, ids=None):
+    # Most values are of one of the exact types in the dispatch table, which
+    # saves going through the chain of (abstract base class) isinstance
+    # checks below.
+    handler = _VALUE_TO_ANY_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value, ids)
+
     if isinstance(value, PyAny):
         return value
 
     if isinstance(value, SerializableObject):
         return PyAny(value)
     if isinstance(value, collections.abc.Mapping):
-        if ids is None:
-            ids = set()
-        d = AnyDictionary()
-        for (k, v) in value.items():
-            if not _is_str(k):
-                raise ValueError(f"key '{k}' is not a string")
-            if id(v) in ids:
-                raise ValueError(
-                    "circular reference converting dictionary to C++ datatype"
-                )
-            ids.add(id(v))
-            d[k] = _value_to_any(v, ids)
-            ids.discard(id(v))
-        return PyAny(d)
+        return _mapping_to_any(value, ids)
     elif _is_nonstring_sequence(value):
-        if ids is None:
-            ids = set()
-        vec = AnyVector()
-        for v in value:
-            if id(v) in ids:
-                raise ValueError(
-                    "circular reference converting dictionary to C++ datatype"
-                )
-            ids.add(id(v))
-            vec.append(_value_to_any(v, ids))
-            ids.discard(id(v))
-        return PyAny(vec)
+        return _sequence_to_any(value, ids)
     else:
-        try:
-            return PyAny(value)
-        except TypeError:
-            # raise an OTIO-specific error
-            raise TypeError(
-                "A value of type '{}' is incompatible with OpenTimelineIO. "
-                "OpenTimelineIO only supports the following value types in "
-                "AnyDictionary containers (like the .metadata dictionary): "
-                "{}.".format(
-                    type(value),
-                    SUPPORTED_VALUE_TYPES,
-                )
+        return _scalar_to_any(value, ids)
+
+
+def _mapping_to_any(value, ids=None):
+    if ids is None:
+        ids = set()
+    d = AnyDictionary()
+    for (k, v) in value.items():
+        if not _is_str(k):
+            raise ValueError(f"key '{k}' is not a string")
+        if id(v) in ids:
+            raise ValueError(
+                "circular reference converting dictionary to C++ datatype"
             )
-        except RuntimeError:
-            # communicate about integer range first
-            biginttype = int
-            if isinstance(value, biginttype):
-                raise ValueError(
-                    "A value of {} is outside of the range of integers that "
-                    "OpenTimelineIO supports, [{}, {}], which is the range of "
-                    "C++ int64_t.".format(
-                        value,
-                        -9223372036854775808,
-                        9223372036854775807,
-                    )
-                )
+        ids.add(id(v))
+        d[k] = _value_to_any(v, ids)
+        ids.discard(id(v))
+    return PyAny(d)
+
+
+def _sequence_to_any(value, ids=None):
+    if ids is None:
+        ids = set()
+    vec = AnyVector()
+    for v in value:
+        if id(v) in ids:
+            raise ValueError(
+                "circular reference converting dictionary to C++ datatype"
+            )
+        ids.add(id(v))
+        vec.append(_value_to_any(v, ids))
+        ids.discard(id(v))
+    return PyAny(vec)
+
 
-            # general catch all for invalid type
+def _scalar_to_any(value, ids=None):
+    try:
+        return PyAny(value)
+    except TypeError:
+        # raise an OTIO-specific error
+        raise TypeError(
+            "A value of type '{}' is incompatible with OpenTimelineIO. "
+            "OpenTimelineIO only supports the following value types in "
+            "AnyDictionary containers (like the .metadata dictionary): "
+            "{}.".format(
+                type(value),
+                SUPPORTED_VALUE_TYPES,
+            )
+        )
+    except RuntimeError:
+        # communicate about integer range first
+        biginttype = int
+        if isinstance(value, biginttype):
             raise ValueError(
-                "The value '{}' of type '{}' is incompatible with OpenTimelineIO. "
-                "OpenTimelineIO only supports the following value types in "
-                "AnyDictionary containers (like the .metadata dictionary): "
-                "{}.".format(
+                "A value of {} is outside of the range of integers that "
+                "OpenTimelineIO supports, [{}, {}], which is the range of "
+                "C++ int64_t.".format(
                     value,
-                    type(value),
-                    SUPPORTED_VALUE_TYPES,
+                    -9223372036854775808,
+                    9223372036854775807,
                 )
             )
 
+        # general catch all for invalid type
+        raise ValueError(
+            "The value '{}' of type '{}' is incompatible with OpenTimelineIO. "
+            "OpenTimelineIO only supports the following value types in "
+            "AnyDictionary containers (like the .metadata dictionary): "
+            "{}.".format(
+                value,
+                type(value),
+                SUPPORTED_VALUE_TYPES,
+            )
+        )
+
+
+def _pyany_to_any(value, ids=None):
+    return value
+
+
+# Conversion functions for exact types, subclasses and other types go through
+# the isinstance checks in _value_to_any.
+_VALUE_TO_ANY_DISPATCH = {
+    PyAny: _pyany_to_any,
+    dict: _mapping_to_any,
+    list: _sequence_to_any,
+    tuple: _sequence_to_any,
+    str: _scalar_to_any,
+    int: _scalar_to_any,
+    float: _scalar_to_any,
+    bool: _scalar_to_any,
+    type(None): _scalar_to_any,
+    _opentime.RationalTime: _scalar_to_any,
+    _opentime.TimeRange: _scalar_to_any,
+    _opentime.TimeTransform: _scalar_to_any,
+}
+
 
 _marker_ = object()
 
@@ -5,31 +5,32 @@ from . _core_utils import add_method
 from .. import _otio
 
 
+def _children_repr(composition):
+    # same text as repr(list(composition)), without copying the children
+    # into a temporary list first
+    return f"[{', '.join(repr(child) for child in composition)}]"
+
+
 @add_method(_otio.Composition)
 def __str__(self):
-    return "{}({}, {}, {}, {})".format(
-        self.__class__.__name__,
-        str(self.name),
-        str(list(self)),
-        str(self.source_range),
-        str(self.metadata)
+    return (
+        f"{self.__class__.__name__}("
+        f"{self.name}, "
+        f"{_children_repr(self)}, "
+        f"{self.source_range}, "
+        f"{self.metadata}"
+        ")"
     )
 
 
 @add_method(_otio.Composition)
 def __repr__(self):
+    module = "core" if self.__class__ is _otio.Composition else "schema"
     return (
-        "otio.{}.{}("
-        "name={}, "
-        "children={}, "
-        "source_range={}, "
-        "metadata={}"
-        ")".format(
-            "core" if self.__class__ is _otio.Composition else "schema",
-            self.__class__.__name__,
-            repr(self.name),
-            repr(list(self)),
-            repr(self.source_range),
-            repr(self.metadata)
-        )
+        f"otio.{module}.{self.__class__.__name__}("
+        f"name={self.name!r}, "
+        f"children={_children_repr(self)}, "
+        f"source_range={self.source_range!r}, "
+        f"metadata={self.metadata!r}"
+        ")"
     )
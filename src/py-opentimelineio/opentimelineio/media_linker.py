@@ -85,9 +85,6 @@ def linked_media_reference(
 
     # @TODO: connect this argument map up to the function call through to the
     #        real linker
-    if not media_linker_argument_map:
-        media_linker_argument_map = {}
-
     return media_linker.link_media_reference(
         target_clip,
         media_linker_argument_map
@@ -104,6 +101,9 @@ class MediaLinker(plugins.PythonPlugin):
         filepath=None,
     ):
         super().__init__(name, filepath)
+        # (module, docstring of its link_media_reference) from the last
+        # plugin_info_map call
+        self._link_doc_cache = None
 
     def link_media_reference(self, in_clip, media_linker_argument_map=None):
         media_linker_argument_map = media_linker_argument_map or {}
@@ -122,7 +122,10 @@ class MediaLinker(plugins.PythonPlugin):
 
         result = super().plugin_info_map()
 
-        fn_doc = inspect.getdoc(self.module().link_media_reference)
+        mod = self.module()
+        if self._link_doc_cache is None or self._link_doc_cache[0] is not mod:
+            self._link_doc_cache = (mod, inspect.getdoc(mod.link_media_reference))
+        fn_doc = self._link_doc_cache[1]
         if fn_doc:
             mod_doc = [result['doc'], ""]
             mod_doc.append(fn_doc)
@@ -134,18 +137,12 @@ class MediaLinker(plugins.PythonPlugin):
         return result
 
     def __str__(self):
-        return "MediaLinker({}, {})".format(
-            repr(self.name),
-            repr(self.filepath)
-        )
+        return f"MediaLinker({self.name!r}, {self.filepath!r})"
 
     def __repr__(self):
         return (
             "otio.media_linker.MediaLinker("
-            "name={}, "
-            "filepath={}"
-            ")".format(
-                repr(self.name),
-                repr(self.filepath)
-            )
+            f"name={self.name!r}, "
+            f"filepath={self.filepath!r}"
+            ")"
         )
@@ -41,25 +41,17 @@ duration_from_start_end_time_inclusive = (
 
 def to_timecode(rt, rate=None, drop_frame=None):
     """Convert a :class:`~RationalTime` into a timecode string."""
-    return (
-        rt.to_timecode()
-        if rate is None and drop_frame is None
-        else rt.to_timecode(rate, drop_frame)
-    )
+    return rt.to_timecode(rate, drop_frame)
 
 
 def to_nearest_timecode(rt, rate=None, drop_frame=None):
     """Convert a :class:`~RationalTime` into a timecode string."""
-    return (
-        rt.to_nearest_timecode()
-        if rate is None and drop_frame is None
-        else rt.to_nearest_timecode(rate, drop_frame)
-    )
+    return rt.to_nearest_timecode(rate, drop_frame)
 
 
 def to_frames(rt, rate=None):
     """Turn a :class:`~RationalTime` into a frame number."""
-    return rt.to_frames() if rate is None else rt.to_frames(rate)
+    return rt.to_frames(rate)
 
 
 def to_seconds(rt):
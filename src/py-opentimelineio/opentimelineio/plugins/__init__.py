@@ -7,6 +7,7 @@
 
 from .python_plugin import (
     plugin_info_map,
+    invalidate_module_cache,
     PythonPlugin,
 )
 
@@ -19,6 +19,23 @@ from . import (
 )
 
 
+# Modules loaded from plugin files, keyed by module name and path, along with
+# the modification time and size of the file they were loaded from, so that
+# reloading the manifest doesn't execute unchanged plugins again.
+_PLUGIN_MODULE_CACHE = {}
+
+
+def invalidate_module_cache():
+    """Forget the modules loaded from plugin files.
+
+    Plugins created afterwards execute their python file again, even if it
+    didn't change on disk. Useful when developing a plugin and editing it in
+    a way that preserves its modification time and size.
+    """
+
+    _PLUGIN_MODULE_CACHE.clear()
+
+
 def plugin_info_map():
     result = {}
     active_manifest = manifest.ActiveManifest()
@@ -41,7 +58,8 @@ def plugin_info_map():
 
     result['hooks'] = copy.deepcopy(active_manifest.hooks)
 
-    result['manifests'] = copy.deepcopy(active_manifest.source_files)
+    # source_files only holds path strings, a shallow copy is enough
+    result['manifests'] = list(active_manifest.source_files)
 
     return result
 
@@ -63,6 +81,10 @@ class PythonPlugin(core.SerializableObject):
         self.filepath = filepath
         self._json_path = None
         self._module = None
+        # ((filepath, _json_path), absolute path) from the last lookup
+        self._abs_path_cache = None
+        # (module, module docstring) from the last plugin_info_map call
+        self._doc_cache = None
 
     name = core.serializable_field("name", doc="Adapter name.")
     filepath = core.serializable_field(
@@ -79,8 +101,12 @@ class PythonPlugin(core.SerializableObject):
 
         result = collections.OrderedDict()
 
+        mod = self.module()
+        if self._doc_cache is None or self._doc_cache[0] is not mod:
+            self._doc_cache = (mod, inspect.getdoc(mod))
+
         result['name'] = self.name
-        result['doc'] = inspect.getdoc(self.module())
+        result['doc'] = self._doc_cache[1]
         result['path'] = self.module_abs_path()
         result['from manifest'] = self._json_path
 
@@ -90,6 +116,10 @@ class PythonPlugin(core.SerializableObject):
         """Return an absolute path to the module implementing this adapter."""
 
         filepath = self.filepath
+        key = (filepath, self._json_path)
+        if self._abs_path_cache is not None and self._abs_path_cache[0] == key:
+            return self._abs_path_cache[1]
+
         if not os.path.isabs(filepath):
             if not self._json_path:
                 raise exceptions.MisconfiguredPluginError(
@@ -102,6 +132,8 @@ class PythonPlugin(core.SerializableObject):
 
             filepath = os.path.join(os.path.dirname(self._json_path), filepath)
 
+        self._abs_path_cache = (key, filepath)
+
         return filepath
 
     def _imported_module(self, namespace):
@@ -113,15 +145,26 @@ class PythonPlugin(core.SerializableObject):
             mod = importlib.import_module(module_name)
         except ImportError:
             # If the module couldn't be imported, import it manually
-            pyname = os.path.splitext(os.path.basename(self.module_abs_path()))[0]
-            pydir = os.path.dirname(self.module_abs_path())
-            spec = importlib.util.spec_from_file_location(
-                module_name,
-                os.path.join(pydir, f"{pyname}.py"),
-            )
+            abs_path = self.module_abs_path()
+            pyname = os.path.splitext(os.path.basename(abs_path))[0]
+            pydir = os.path.dirname(abs_path)
+            filepath = os.path.join(pydir, f"{pyname}.py")
+
+            # re-use the module if the file didn't change since it was loaded
+            cache_key = (module_name, filepath)
+            stat = os.stat(filepath)
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+            cached_stamp, mod = _PLUGIN_MODULE_CACHE.get(cache_key, (None, None))
+            if mod is None or cached_stamp != file_stamp:
+                spec = importlib.util.spec_from_file_location(
+                    module_name,
+                    filepath,
+                )
 
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
+                mod = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(mod)
+                # replaces the module loaded from an older version of the file
+                _PLUGIN_MODULE_CACHE[cache_key] = (file_stamp, mod)
 
         return mod
 
@@ -137,8 +180,9 @@ class PythonPlugin(core.SerializableObject):
         """Execute func_name on this adapter with error checking."""
 
         # collects the error handling into a common place.
-        if not hasattr(self.module(), func_name):
+        func = getattr(self.module(), func_name, None)
+        if func is None:
             raise exceptions.AdapterDoesntSupportFunctionError(
                 f"Sorry, {self.name} doesn't support {func_name}."
             )
-        return (getattr(self.module(), func_name)(**kwargs))
+        return func(**kwargs)
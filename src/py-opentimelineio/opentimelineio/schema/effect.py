@@ -9,14 +9,10 @@ from .. import _otio
 def __str__(self):
     return (
         "Effect("
-        "{}, "
-        "{}, "
-        "{}"
-        ")".format(
-            str(self.name),
-            str(self.effect_name),
-            str(self.metadata),
-        )
+        f"{self.name}, "
+        f"{self.effect_name}, "
+        f"{self.metadata}"
+        ")"
     )
 
 
@@ -24,12 +20,8 @@ def __str__(self):
 def __repr__(self):
     return (
         "otio.schema.Effect("
-        "name={}, "
-        "effect_name={}, "
-        "metadata={}"
-        ")".format(
-            repr(self.name),
-            repr(self.effect_name),
-            repr(self.metadata),
-        )
+        f"name={self.name!r}, "
+        f"effect_name={self.effect_name!r}, "
+        f"metadata={self.metadata!r}"
+        ")"
     )
@@ -7,23 +7,15 @@ from .. import _otio
 
 @add_method(_otio.Marker)
 def __str__(self):
-    return "Marker({}, {}, {})".format(
-        str(self.name),
-        str(self.marked_range),
-        str(self.metadata),
-    )
+    return f"Marker({self.name}, {self.marked_range}, {self.metadata})"
 
 
 @add_method(_otio.Marker)
 def __repr__(self):
     return (
         "otio.schema.Marker("
-        "name={}, "
-        "marked_range={}, "
-        "metadata={}"
-        ")".format(
-            repr(self.name),
-            repr(self.marked_range),
-            repr(self.metadata),
-        )
+        f"name={self.name!r}, "
+        f"marked_range={self.marked_range!r}, "
+        f"metadata={self.metadata!r}"
+        ")"
     )
@@ -85,6 +85,70 @@ class TestPluginAdapters(unittest.TestCase):
         # call through the convienence wrapper
         self.assertEqual(self.adp.read_from_file("foo").name, "foo")
 
+    def test_load_adapter_module_shared(self):
+        # another plugin object for the same, unchanged, file re-uses the
+        # module rather than executing it again
+        other_adp = otio.adapters.read_from_string(self.jsn, 'otio_json')
+        other_adp._json_path = self.adp._json_path
+
+        self.assertIs(other_adp.module(), self.adp.module())
+
+        # unless the cache was invalidated in between
+        otio.plugins.invalidate_module_cache()
+        third_adp = otio.adapters.read_from_string(self.jsn, 'otio_json')
+        third_adp._json_path = self.adp._json_path
+
+        self.assertIsNot(third_adp.module(), self.adp.module())
+
+    def test_load_adapter_module_reloads_changed_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plugin_path = os.path.join(temp_dir, "changing_adapter.py")
+            with open(plugin_path, "w") as fo:
+                fo.write("VALUE = 1\n")
+            stat = os.stat(plugin_path)
+
+            adp = otio.adapters.Adapter(
+                name="changing_adapter",
+                filepath=plugin_path,
+                suffixes=[]
+            )
+            self.assertEqual(adp.module().VALUE, 1)
+
+            # rewrite the file without changing its modification time
+            with open(plugin_path, "w") as fo:
+                fo.write("VALUE = 22\n")
+            os.utime(plugin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            other_adp = otio.adapters.Adapter(
+                name="changing_adapter",
+                filepath=plugin_path,
+                suffixes=[]
+            )
+            self.assertEqual(other_adp.module().VALUE, 22)
+
+    def test_module_abs_path_follows_json_path(self):
+        self.assertEqual(
+            os.path.basename(self.adp.module_abs_path()),
+            "example.py"
+        )
+
+        # moving the manifest moves the module with it
+        self.adp._json_path = os.path.join("somewhere", "else", ADAPTER_PATH)
+        self.assertEqual(
+            self.adp.module_abs_path(),
+            os.path.join("somewhere", "else", "example.py")
+        )
+
+        self.adp.filepath = "other.py"
+        self.assertEqual(
+            self.adp.module_abs_path(),
+            os.path.join("somewhere", "else", "other.py")
+        )
+
+        self.adp._json_path = None
+        with self.assertRaises(otio.exceptions.MisconfiguredPluginError):
+            self.adp.module_abs_path()
+
     def test_has_feature(self):
         self.assertTrue(self.adp.has_feature("read"))
         self.assertTrue(self.adp.has_feature("read_from_file"))
@@ -173,6 +173,32 @@ class TestTime(unittest.TestCase):
         self.assertEqual(timecode, otio.opentime.to_timecode(t, 24))
         self.assertEqual(t, otio.opentime.from_timecode(timecode, 24))
 
+    def test_timecode_optional_arguments(self):
+        t = otio.opentime.RationalTime(100, 30000 / 1001)
+
+        # None means "use the rate of the time" and "infer drop frame"
+        self.assertEqual(
+            otio.opentime.to_timecode(t, None, None),
+            otio.opentime.to_timecode(t)
+        )
+        self.assertEqual(
+            otio.opentime.to_timecode(t, drop_frame=False),
+            t.to_timecode(t.rate, False)
+        )
+        self.assertEqual(
+            otio.opentime.to_nearest_timecode(t, None),
+            t.to_nearest_timecode()
+        )
+        self.assertEqual(otio.opentime.to_frames(t, None), 100)
+        self.assertEqual(t.to_frames(rate=t.rate * 2), 200)
+
+        # the time can be passed by keyword to the module level functions
+        self.assertEqual(
+            otio.opentime.to_timecode(rt=t, rate=24),
+            t.to_timecode(24)
+        )
+        self.assertEqual(otio.opentime.to_seconds(rt=t), t.to_seconds())
+
     def test_long_running_timecode_24(self):
         final_frame_number = 24 * 60 * 60 * 24 - 1
         final_time = otio.opentime.from_frames(final_frame_number, 24)
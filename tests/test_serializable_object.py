@@ -6,6 +6,7 @@
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
 
+import inspect
 import unittest
 import json
 
@@ -80,6 +81,29 @@ class SerializableObjTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
         self.assertEqual(Foo, type(foo_copy))
 
+    def test_serializable_field_required_type(self):
+        @otio.core.register_type
+        class Typed(otio.core.SerializableObject):
+            _serializable_label = "TypedFieldStuff.1"
+            number = otio.core.serializable_field("number", required_type=int)
+            anything = otio.core.serializable_field("anything")
+
+        typed = Typed()
+        typed.number = 3
+        self.assertEqual(typed.number, 3)
+
+        # subclasses of the required type and None are accepted
+        typed.number = True
+        self.assertEqual(typed.number, True)
+        typed.number = None
+        self.assertIsNone(typed.number)
+
+        with self.assertRaises(TypeError):
+            typed.number = "three"
+
+        typed.anything = "three"
+        self.assertEqual(typed.anything, "three")
+
     def test_equality(self):
         o1 = otio.core.SerializableObject()
         o2 = otio.core.SerializableObject()
@@ -166,6 +190,55 @@ class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         ft = otio.core.instance_from_schema("Stuff", 1, {"foo": "bar"})
         self.assertEqual(ft._dynamic_fields['foo'], "bar")
 
+    def test_register_type_wraps_init_once(self):
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "WrapOnceStuff.1"
+
+        wrapped_init = FakeThing.__init__
+        otio.core.register_type(FakeThing)
+        self.assertIs(FakeThing.__init__, wrapped_init)
+
+        # a registered subclass still gets its own schema
+        @otio.core.register_type
+        class FakeSubThing(FakeThing):
+            _serializable_label = "WrapOnceSubStuff.1"
+
+        self.assertEqual(FakeThing().schema_name(), "WrapOnceStuff")
+        self.assertEqual(FakeSubThing().schema_name(), "WrapOnceSubStuff")
+
+        # and wraps the original __init__ instead of the parent's wrapper
+        self.assertIs(
+            FakeSubThing.__init__._otio_orig_init,
+            FakeThing.__init__._otio_orig_init
+        )
+
+    def test_register_type_again_with_new_schema_name(self):
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "ReRegisterStuff.1"
+
+        orig_init = FakeThing.__init__._otio_orig_init
+
+        # registering under another name re-wraps the original __init__
+        otio.core.register_type(FakeThing, "ReRegisterStuffAlias")
+        self.assertEqual(FakeThing().schema_name(), "ReRegisterStuffAlias")
+        self.assertIs(FakeThing.__init__._otio_orig_init, orig_init)
+
+    def test_register_type_init_signature(self):
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "SignatureStuff.1"
+
+        # the wrapper doesn't add any parameters of its own
+        self.assertEqual(
+            list(inspect.signature(FakeThing.__init__).parameters),
+            ["self", "args", "kwargs"]
+        )
+
+        with self.assertRaises(TypeError):
+            FakeThing(_schema_name="SomethingElse")
+
     @unittest.skip("@TODO: disabled pending discussion")
     def test_double_register_schema(self):
         @otio.core.register_type
@@ -212,6 +285,31 @@ class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         ft = otio.core.instance_from_schema("NewStuff", 4, {"foo_3": "bar"})
         self.assertEqual(ft._dynamic_fields['foo_3'], "bar")
 
+    def test_upgrade_in_place(self):
+        """Test upgrade functions that modify the dictionary in place"""
+
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "InPlaceStuff.3"
+            foo_three = otio.core.serializable_field("foo_3")
+
+        @otio.core.upgrade_function_for(FakeThing, 2)
+        def upgrade_one_to_two(_data_dict):
+            _data_dict["foo_2"] = _data_dict.pop("foo")
+            return _data_dict
+
+        @otio.core.upgrade_function_for(FakeThing, 3)
+        def upgrade_two_to_three(_data_dict):
+            _data_dict["foo_3"] = _data_dict.pop("foo_2")
+
+        ft = otio.core.instance_from_schema(
+            "InPlaceStuff", 1, {"foo": "bar", "other": 1}
+        )
+        self.assertEqual(ft._dynamic_fields['foo_3'], "bar")
+        self.assertEqual(ft._dynamic_fields['other'], 1)
+        self.assertNotIn('foo', ft._dynamic_fields)
+        self.assertNotIn('foo_2', ft._dynamic_fields)
+
     def test_upgrade_rename(self):
         """test that upgrading system handles schema renames correctly"""
 